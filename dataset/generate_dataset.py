@@ -5,14 +5,20 @@ Generates synthetic medical records for testing Searchable Symmetric Encryption
 """
 
 import argparse
+import heapq
 import json
+import multiprocessing
 import os
 import random
 import string
+from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Set
 
+import numpy as np
+
 # Try to import Faker for realistic names, fall back to simple names if not available
 try:
     from faker import Faker
@@ -62,6 +68,12 @@ TREATMENTS = [
     "elettrocardiogramma", "holter cardiaco", "spirometria"
 ]
 
+# Lowercased keyword tokens are computed once at import so that
+# generate_document does not re-run .lower().split() on the same
+# diagnosis/treatment strings for every document.
+DIAGNOSIS_TOKENS = {d: d.lower().split() for d in DIAGNOSES}
+TREATMENT_TOKENS = {t: t.lower().split() for t in TREATMENTS}
+
 CLINICAL_NOTES_TEMPLATES = [
     "Paziente presenta {symptoms}. Si consiglia {recommendation}.",
     "Esame obiettivo: {findings}. Diagnosi: {diagnosis}. Terapia: {therapy}.",
@@ -89,92 +101,133 @@ SIMPLE_LAST_NAMES = [
     "Ricci", "Marino", "Greco", "Bruno", "Gallo", "Conti", "Costa", "Mancini"
 ]
 
+# Per-process PRNG instance. Bound-method calls on it skip the module
+# attribute indirection of the random.* functions, and each worker
+# re-seeds it explicitly instead of mutating shared global state.
+prng = random.Random()
 
-def generate_patient_id() -> str:
-    """Generate a unique patient ID."""
-    return f"PAT{random.randint(100000, 999999)}"
 
-
-def generate_document_id() -> str:
-    """Generate a unique document ID."""
-    return f"DOC{random.randint(1000000, 9999999)}"
+@lru_cache(maxsize=None)
+def cached_lower(value: str) -> str:
+    """Cached str.lower for values drawn from small pools (names, departments)."""
+    return value.lower()
 
 
 def get_random_name() -> tuple:
     """Generate a random first and last name."""
     if USE_FAKER:
         return fake.first_name(), fake.last_name()
-    return random.choice(SIMPLE_FIRST_NAMES), random.choice(SIMPLE_LAST_NAMES)
+    return prng.choice(SIMPLE_FIRST_NAMES), prng.choice(SIMPLE_LAST_NAMES)
+
+
+# Templates are parsed once at import into (literal, field) segments so each
+# call generates values only for the fields its template actually uses,
+# instead of computing all 14 replacements and scanning the string 14 times.
+COMPILED_TEMPLATES = [
+    [(literal, field) for literal, field, _, _ in string.Formatter().parse(t)]
+    for t in CLINICAL_NOTES_TEMPLATES
+]
+
+FIELD_GENERATORS = {
+    "symptoms": lambda: ", ".join(prng.sample(SYMPTOMS, prng.randint(1, 3))),
+    "recommendation": lambda: prng.choice(TREATMENTS),
+    "findings": lambda: prng.choice(["obiettività cardiaca nei limiti", "addome trattabile", "torace eupnoico"]),
+    "diagnosis": lambda: prng.choice(DIAGNOSES),
+    "therapy": lambda: prng.choice(TREATMENTS),
+    "condition": lambda: prng.choice(["stabili", "migliorate", "stazionarie"]),
+    "reason": lambda: prng.choice(DIAGNOSES),
+    "duration": lambda: str(prng.randint(2, 14)),
+    "prescription": lambda: prng.choice(TREATMENTS),
+    "followup": lambda: str(prng.randint(1, 8)),
+    "lab_results": lambda: "emocromo, glicemia, creatinina, transaminasi",
+    "exceptions": lambda: prng.choice(["glicemia lievemente elevata", "lieve anemia", "creatinina ai limiti"]),
+    "specialist_notes": lambda: prng.choice(["quadro compatibile con", "si conferma diagnosi di", "da escludere"]) + " " + prng.choice(DIAGNOSES),
+    "procedure": lambda: prng.choice(TREATMENTS)
+}
 
 
 def generate_clinical_notes() -> str:
     """Generate random clinical notes."""
-    template = random.choice(CLINICAL_NOTES_TEMPLATES)
-    
-    replacements = {
-        "{symptoms}": ", ".join(random.sample(SYMPTOMS, random.randint(1, 3))),
-        "{recommendation}": random.choice(TREATMENTS),
-        "{findings}": random.choice(["obiettività cardiaca nei limiti", "addome trattabile", "torace eupnoico"]),
-        "{diagnosis}": random.choice(DIAGNOSES),
-        "{therapy}": random.choice(TREATMENTS),
-        "{condition}": random.choice(["stabili", "migliorate", "stazionarie"]),
-        "{reason}": random.choice(DIAGNOSES),
-        "{duration}": str(random.randint(2, 14)),
-        "{prescription}": random.choice(TREATMENTS),
-        "{followup}": str(random.randint(1, 8)),
-        "{lab_results}": "emocromo, glicemia, creatinina, transaminasi",
-        "{exceptions}": random.choice(["glicemia lievemente elevata", "lieve anemia", "creatinina ai limiti"]),
-        "{specialist_notes}": random.choice(["quadro compatibile con", "si conferma diagnosi di", "da escludere"]) + " " + random.choice(DIAGNOSES),
-        "{procedure}": random.choice(TREATMENTS)
+    segments = prng.choice(COMPILED_TEMPLATES)
+    # Dispatch straight from the generator table; building an
+    # intermediate replacements dict per call is unnecessary since each
+    # field occurs at most once per template.
+    return "".join(
+        literal if field is None else literal + FIELD_GENERATORS[field]()
+        for literal, field in segments
+    )
+
+
+def presample_documents(rng: np.random.Generator, num_docs: int) -> Dict[str, np.ndarray]:
+    """Pre-sample the per-document random values for all documents at once.
+
+    Drawing the values in a handful of vectorized NumPy calls replaces
+    ~5 Python-level random.* calls per document with C-level batch sampling.
+    The diagnosis/treatment picks are sample-without-replacement: each row
+    holds a random permutation prefix, of which the first numDiagnoses /
+    numTreatments entries are used.
+    """
+    diagnosis_perms = rng.permuted(
+        np.tile(np.arange(len(DIAGNOSES)), (num_docs, 1)), axis=1)
+    treatment_perms = rng.permuted(
+        np.tile(np.arange(len(TREATMENTS)), (num_docs, 1)), axis=1)
+    return {
+        "docId": rng.integers(1000000, 10000000, num_docs),
+        "patientId": rng.integers(100000, 1000000, num_docs),
+        "age": rng.integers(18, 96, num_docs),
+        "departmentIdx": rng.integers(0, len(DEPARTMENTS), num_docs),
+        "numDiagnoses": rng.integers(1, 6, num_docs),
+        "numTreatments": rng.integers(1, 7, num_docs),
+        "diagnosisIdx": diagnosis_perms[:, :5].copy(),
+        "treatmentIdx": treatment_perms[:, :6].copy(),
+        "daysAgo": rng.integers(0, 1826, num_docs),
     }
-    
-    for key, value in replacements.items():
-        template = template.replace(key, value)
-    
-    return template
 
 
-def generate_document(doc_index: int) -> Dict:
-    """Generate a single e-health document."""
+def generate_document(doc_index: int, samples: Dict[str, np.ndarray]) -> Dict:
+    """Generate a single e-health document from pre-sampled random values."""
     first_name, last_name = get_random_name()
-    age = random.randint(18, 95)
-    department = random.choice(DEPARTMENTS)
-    
+    age = int(samples["age"][doc_index])
+    department = DEPARTMENTS[samples["departmentIdx"][doc_index]]
+
     # Number of diagnoses and treatments follow a power law distribution
-    num_diagnoses = min(random.randint(1, 5), len(DIAGNOSES))
-    num_treatments = min(random.randint(1, 6), len(TREATMENTS))
-    
-    diagnoses = random.sample(DIAGNOSES, num_diagnoses)
-    treatments = random.sample(TREATMENTS, num_treatments)
-    
+    num_diagnoses = int(samples["numDiagnoses"][doc_index])
+    num_treatments = int(samples["numTreatments"][doc_index])
+
+    diagnoses = [DIAGNOSES[j] for j in samples["diagnosisIdx"][doc_index, :num_diagnoses]]
+    treatments = [TREATMENTS[j] for j in samples["treatmentIdx"][doc_index, :num_treatments]]
+
     # Generate admission date within last 5 years
-    days_ago = random.randint(0, 1825)
+    days_ago = int(samples["daysAgo"][doc_index])
     admission_date = (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
     
     clinical_notes = generate_clinical_notes()
     
-    # Build keywords list (all searchable terms)
-    keywords = set()
-    keywords.add(first_name.lower())
-    keywords.add(last_name.lower())
-    keywords.add(department.lower())
+    # Build keywords list (all searchable terms); dict.fromkeys dedupes in
+    # C while keeping insertion order, so keyword order is deterministic
+    # (set iteration order varies with string hash randomization).
+    keywords = [
+        cached_lower(first_name),
+        cached_lower(last_name),
+        cached_lower(department)
+    ]
     for d in diagnoses:
-        keywords.update(d.lower().split())
+        keywords.extend(DIAGNOSIS_TOKENS[d])
     for t in treatments:
-        keywords.update(t.lower().split())
+        keywords.extend(TREATMENT_TOKENS[t])
     # Add age ranges as keywords
     if age < 30:
-        keywords.add("giovane")
+        keywords.append("giovane")
     elif age < 50:
-        keywords.add("adulto")
+        keywords.append("adulto")
     elif age < 70:
-        keywords.add("anziano")
+        keywords.append("anziano")
     else:
-        keywords.add("molto_anziano")
+        keywords.append("molto_anziano")
     
     return {
-        "docId": generate_document_id(),
-        "patientId": generate_patient_id(),
+        "docId": f"DOC{samples['docId'][doc_index]}",
+        "patientId": f"PAT{samples['patientId'][doc_index]}",
         "firstName": first_name,
         "lastName": last_name,
         "age": age,
@@ -183,7 +236,7 @@ def generate_document(doc_index: int) -> Dict:
         "treatments": treatments,
         "admissionDate": admission_date,
         "clinicalNotes": clinical_notes,
-        "keywords": sorted(list(keywords))
+        "keywords": list(dict.fromkeys(keywords))
     }
 
 
@@ -198,10 +251,10 @@ def generate_text_content(doc: Dict) -> str:
         f"Admission Date: {doc['admissionDate']}",
         "",
         "Diagnoses:",
-        *[f"  - {d}" for d in doc['diagnoses']],
+        "  - " + "\n  - ".join(doc['diagnoses']),
         "",
         "Treatments:",
-        *[f"  - {t}" for t in doc['treatments']],
+        "  - " + "\n  - ".join(doc['treatments']),
         "",
         "Clinical Notes:",
         doc['clinicalNotes'],
@@ -212,40 +265,22 @@ def generate_text_content(doc: Dict) -> str:
     return "\n".join(lines)
 
 
-def build_keyword_index(documents: List[Dict]) -> Dict[str, List[str]]:
-    """Build an inverted index from keywords to document IDs."""
-    index = {}
-    for doc in documents:
-        doc_id = doc['docId']
-        for keyword in doc['keywords']:
-            if keyword not in index:
-                index[keyword] = []
-            index[keyword].append(doc_id)
-    return index
-
-
-def compute_statistics(documents: List[Dict], keyword_index: Dict[str, List[str]]) -> Dict:
-    """Compute dataset statistics."""
-    total_keywords = sum(len(doc['keywords']) for doc in documents)
+def compute_statistics(num_docs: int, keyword_index: Dict[str, List[str]], counters: Dict) -> Dict:
+    """Compute dataset statistics from the counters accumulated during generation."""
     keyword_frequencies = {k: len(v) for k, v in keyword_index.items()}
-    
+
     return {
-        "numDocuments": len(documents),
+        "numDocuments": num_docs,
         "numUniqueKeywords": len(keyword_index),
-        "avgKeywordsPerDocument": round(total_keywords / len(documents), 2),
-        "minKeywordsPerDocument": min(len(doc['keywords']) for doc in documents),
-        "maxKeywordsPerDocument": max(len(doc['keywords']) for doc in documents),
+        "avgKeywordsPerDocument": round(counters["totalKeywords"] / num_docs, 2),
+        "minKeywordsPerDocument": counters["minKeywords"],
+        "maxKeywordsPerDocument": counters["maxKeywords"],
         "avgDocumentsPerKeyword": round(sum(keyword_frequencies.values()) / len(keyword_frequencies), 2),
         "minDocumentsPerKeyword": min(keyword_frequencies.values()),
         "maxDocumentsPerKeyword": max(keyword_frequencies.values()),
-        "topKeywords": sorted(keyword_frequencies.items(), key=lambda x: -x[1])[:20],
-        "departments": list(set(doc['department'] for doc in documents)),
-        "ageDistribution": {
-            "under30": sum(1 for doc in documents if doc['age'] < 30),
-            "30to49": sum(1 for doc in documents if 30 <= doc['age'] < 50),
-            "50to69": sum(1 for doc in documents if 50 <= doc['age'] < 70),
-            "70plus": sum(1 for doc in documents if doc['age'] >= 70)
-        }
+        "topKeywords": heapq.nlargest(20, keyword_frequencies.items(), key=lambda x: x[1]),
+        "departments": list(counters["departments"]),
+        "ageDistribution": counters["ageDistribution"]
     }
 
 
@@ -253,6 +288,17 @@ def generate_test_queries(keyword_index: Dict[str, List[str]], num_queries: int
     """Generate test queries for benchmarking."""
     queries = []
     keywords = list(keyword_index.keys())
+
+    # Posting lists are converted once per requested keyword into sorted
+    # unique NumPy arrays so the AND/OR result counts come from C-level
+    # set operations instead of building Python sets per query.
+    posting_arrays = {}
+
+    def postings(keyword: str) -> np.ndarray:
+        array = posting_arrays.get(keyword)
+        if array is None:
+            array = posting_arrays[keyword] = np.unique(np.asarray(keyword_index[keyword]))
+        return array
     
     # Sort keywords by frequency
     by_frequency = sorted(keywords, key=lambda k: len(keyword_index[k]))
@@ -263,7 +309,7 @@ def generate_test_queries(keyword_index: Dict[str, List[str]], num_queries: int
     # Single keyword queries - mix of frequencies
     for category, kw_list in [("rare", rare_keywords), ("medium", medium_keywords), ("common", common_keywords)]:
         sample_size = min(5, len(kw_list))
-        for kw in random.sample(kw_list, sample_size):
+        for kw in prng.sample(kw_list, sample_size):
             queries.append({
                 "type": "single",
                 "category": category,
@@ -273,23 +319,19 @@ def generate_test_queries(keyword_index: Dict[str, List[str]], num_queries: int
     
     # AND queries (conjunction)
     for _ in range(10):
-        kw1, kw2 = random.sample(keywords, 2)
-        results1 = set(keyword_index[kw1])
-        results2 = set(keyword_index[kw2])
-        intersection = results1 & results2
+        kw1, kw2 = prng.sample(keywords, 2)
+        intersection = np.intersect1d(postings(kw1), postings(kw2), assume_unique=True)
         queries.append({
             "type": "AND",
             "category": "conjunction",
             "keywords": [kw1, kw2],
             "expectedResults": len(intersection)
         })
-    
+
     # OR queries (disjunction)
     for _ in range(10):
-        kw1, kw2 = random.sample(keywords, 2)
-        results1 = set(keyword_index[kw1])
-        results2 = set(keyword_index[kw2])
-        union = results1 | results2
+        kw1, kw2 = prng.sample(keywords, 2)
+        union = np.union1d(postings(kw1), postings(kw2))
         queries.append({
             "type": "OR",
             "category": "disjunction",
@@ -300,61 +342,168 @@ def generate_test_queries(keyword_index: Dict[str, List[str]], num_queries: int
     return queries
 
 
+# Number of text files buffered in memory before they are flushed to disk.
+# Writing in batches keeps the open/write/close syscalls out of the hot
+# generation loop instead of interleaving one file per document.
+WRITE_BATCH_SIZE = 1000
+
+# Number of documents generated per worker task when parallelizing.
+GENERATION_CHUNK_SIZE = 1000
+
+
+def generate_chunk(task: tuple) -> List[Dict]:
+    """Generate one chunk of documents (multiprocessing worker).
+
+    Receives the pre-sampled array slices for the chunk plus a seed for
+    the remaining random.* calls (names, samples, clinical notes), so
+    each worker produces a deterministic chunk under a fixed --seed.
+    """
+    chunk_samples, chunk_seed = task
+    # Unseeded runs draw fresh entropy per chunk so forked workers never
+    # replay the PRNG state inherited from the parent process.
+    seed_value = os.urandom(16) if chunk_seed is None else chunk_seed
+    prng.seed(seed_value)
+    if USE_FAKER:
+        Faker.seed(seed_value)
+    count = len(chunk_samples["age"])
+    return [generate_document(i, chunk_samples) for i in range(count)]
+
+
+def flush_text_batch(batch: List[tuple], dir_fd: int) -> None:
+    """Write buffered (filename, content) pairs to disk and clear the buffer.
+
+    Files are created relative to a pre-opened directory fd with raw
+    os.open/os.write/os.close, so each file costs exactly three syscalls
+    with no per-file path resolution or Python file-object layer.
+    """
+    for filename, content in batch:
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+        try:
+            os.write(fd, content.encode('utf-8'))
+        finally:
+            os.close(fd)
+    batch.clear()
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate synthetic e-health dataset for SSE benchmarking')
     parser.add_argument('--num-docs', type=int, default=1000, help='Number of documents to generate')
     parser.add_argument('--output-dir', type=str, default='./data', help='Output directory')
     parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducibility')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for document generation (default: number of CPUs)')
+    parser.add_argument('--no-text-files', action='store_true',
+                        help='Skip the per-document .txt files (only needed for file-based Clusion indexing)')
     args = parser.parse_args()
     
     if args.seed is not None:
-        random.seed(args.seed)
+        prng.seed(args.seed)
         if USE_FAKER:
             Faker.seed(args.seed)
+    rng = np.random.default_rng(args.seed)
     
     output_dir = Path(args.output_dir)
     docs_dir = output_dir / "documents"
-    
+    write_text_files = not args.no_text_files
+
     # Create directories
     output_dir.mkdir(parents=True, exist_ok=True)
-    docs_dir.mkdir(parents=True, exist_ok=True)
+    if write_text_files:
+        docs_dir.mkdir(parents=True, exist_ok=True)
     
     print(f"Generating {args.num_docs} documents...")
     
-    # Generate documents
-    documents = []
-    for i in range(args.num_docs):
-        doc = generate_document(i)
-        documents.append(doc)
-        
-        # Write individual text file
-        text_content = generate_text_content(doc)
-        with open(docs_dir / f"{doc['docId']}.txt", 'w', encoding='utf-8') as f:
-            f.write(text_content)
-        
-        if (i + 1) % 100 == 0:
-            print(f"  Generated {i + 1}/{args.num_docs} documents")
-    
-    # Build keyword index
-    print("Building keyword index...")
-    keyword_index = build_keyword_index(documents)
-    
+    # Generate documents, building the inverted index and the statistics
+    # counters in the same pass instead of re-iterating the document list.
+    # dataset.json is streamed one document at a time so the complete
+    # document list never has to be held in memory.
+    samples = presample_documents(rng, args.num_docs)
+    text_batch = []
+    keyword_index = defaultdict(list)
+    total_keywords = 0
+    min_keywords = float('inf')
+    max_keywords = 0
+    departments_seen = set()
+    # All ages are pre-sampled, so the four buckets come from a single
+    # bincount over the age array instead of a branch per document.
+    age_buckets = np.bincount(np.digitize(samples["age"], (30, 50, 70)), minlength=4)
+    age_distribution = {
+        "under30": int(age_buckets[0]),
+        "30to49": int(age_buckets[1]),
+        "50to69": int(age_buckets[2]),
+        "70plus": int(age_buckets[3])
+    }
+    # Split the pre-sampled arrays into chunks and fan the CPU-bound
+    # document generation out over a process pool; the main process keeps
+    # all I/O and the index/statistics accumulation.
+    tasks = []
+    for chunk_idx, start in enumerate(range(0, args.num_docs, GENERATION_CHUNK_SIZE)):
+        end = min(start + GENERATION_CHUNK_SIZE, args.num_docs)
+        chunk_samples = {key: values[start:end] for key, values in samples.items()}
+        chunk_seed = None if args.seed is None else args.seed + chunk_idx + 1
+        tasks.append((chunk_samples, chunk_seed))
+
+    i = 0
+    # All text files are written relative to a single directory fd opened
+    # once up front (see flush_text_batch).
+    docs_dir_fd = os.open(docs_dir, os.O_RDONLY) if write_text_files else -1
+    try:
+        with open(output_dir / "dataset.json", 'w', encoding='utf-8') as dataset_file, \
+                multiprocessing.Pool(args.workers) as pool:
+            dataset_file.write('[')
+            for chunk in pool.imap(generate_chunk, tasks):
+                for doc in chunk:
+                    if i > 0:
+                        dataset_file.write(',')
+                    json.dump(doc, dataset_file, ensure_ascii=False)
+
+                    for keyword in doc['keywords']:
+                        keyword_index[keyword].append(doc['docId'])
+                    num_keywords = len(doc['keywords'])
+                    total_keywords += num_keywords
+                    min_keywords = min(min_keywords, num_keywords)
+                    max_keywords = max(max_keywords, num_keywords)
+                    departments_seen.add(doc['department'])
+
+                    # Buffer individual text files and write them in batches
+                    if write_text_files:
+                        text_content = generate_text_content(doc)
+                        text_batch.append((f"{doc['docId']}.txt", text_content))
+                        if len(text_batch) >= WRITE_BATCH_SIZE:
+                            flush_text_batch(text_batch, docs_dir_fd)
+
+                    i += 1
+                    if i % 100 == 0:
+                        print(f"  Generated {i}/{args.num_docs} documents")
+            dataset_file.write(']')
+        flush_text_batch(text_batch, docs_dir_fd)
+    finally:
+        if docs_dir_fd >= 0:
+            os.close(docs_dir_fd)
+    keyword_index = dict(keyword_index)
+
     # Compute statistics
     print("Computing statistics...")
-    stats = compute_statistics(documents, keyword_index)
+    counters = {
+        "totalKeywords": total_keywords,
+        "minKeywords": min_keywords,
+        "maxKeywords": max_keywords,
+        "departments": departments_seen,
+        "ageDistribution": age_distribution
+    }
+    stats = compute_statistics(args.num_docs, keyword_index, counters)
     
     # Generate test queries
     print("Generating test queries...")
     test_queries = generate_test_queries(keyword_index)
     
-    # Save files
+    # Save files (dataset.json was already streamed during generation)
     print("Saving files...")
-    
-    with open(output_dir / "dataset.json", 'w', encoding='utf-8') as f:
-        json.dump(documents, f, indent=2, ensure_ascii=False)
-    
+
+    # The large index is written compact: indent=2 disables the
+    # C-accelerated json encoder and roughly triples the file size.
     with open(output_dir / "keyword_index.json", 'w', encoding='utf-8') as f:
-        json.dump(keyword_index, f, indent=2, ensure_ascii=False)
+        json.dump(keyword_index, f, ensure_ascii=False)
     
     with open(output_dir / "statistics.json", 'w', encoding='utf-8') as f:
         json.dump(stats, f, indent=2, ensure_ascii=False)
@@ -363,13 +512,14 @@ def main():
         json.dump(test_queries, f, indent=2, ensure_ascii=False)
     
     print(f"\n=== Generation Complete ===")
-    print(f"Documents generated: {len(documents)}")
+    print(f"Documents generated: {args.num_docs}")
     print(f"Unique keywords: {len(keyword_index)}")
     print(f"Average keywords per document: {stats['avgKeywordsPerDocument']}")
     print(f"Test queries generated: {len(test_queries)}")
     print(f"\nOutput directory: {output_dir.absolute()}")
     print(f"  - dataset.json: Complete dataset")
-    print(f"  - documents/: Individual text files ({len(documents)} files)")
+    if write_text_files:
+        print(f"  - documents/: Individual text files ({args.num_docs} files)")
     print(f"  - keyword_index.json: Inverted index")
     print(f"  - statistics.json: Dataset statistics")
     print(f"  - test_queries.json: Benchmark queries")